@@ -0,0 +1,14 @@
+"""
+Gunicorn configuration for the marketplace checker.
+
+preload_app loads the JSON product files and builds the search indexes once in
+the master process before forking; the workers then share that memory through
+copy-on-write instead of each holding (and re-parsing) its own copy. The data
+structures are frozen after load, so the shared pages are never dirtied.
+"""
+import multiprocessing
+
+wsgi_app = "wsgi:app"
+bind = "127.0.0.1:5000"
+workers = multiprocessing.cpu_count()
+preload_app = True
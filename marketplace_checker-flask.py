@@ -1,6 +1,57 @@
+import bisect
+import functools
 import json
 import os
-from flask import Flask, render_template_string, request, url_for, redirect
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from flask import Flask, request, url_for, redirect
+
+# Optional SIMD-accelerated JSON parser (pysimdjson). One parser per loader
+# thread: its internal padded buffer is reused across files but must not be
+# shared between threads parsing concurrently.
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Optional orjson, used when pysimdjson is not installed: a Rust implementation
+# with SIMD-accelerated scanning, still 2-3x faster than the stdlib parser.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional ijson: streams top-level arrays record by record, so products that
+# fail the price filter are discarded during parsing instead of being held in
+# memory alongside the survivors.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_PARSER_LOCAL = threading.local()
+
+
+def _get_simdjson_parser():
+    """Returns this thread's simdjson parser, or None if pysimdjson is not installed."""
+    if simdjson is None:
+        return None
+    parser = getattr(_PARSER_LOCAL, 'parser', None)
+    if parser is None:
+        parser = _PARSER_LOCAL.parser = simdjson.Parser()
+    return parser
+
+# Optional NumPy: turns the sort-key sidecars into compact integer columns so
+# the per-query ordering runs as a single vectorized lexsort instead of a
+# Python-level key function.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # --- Configuration and Data Loading Setup ---
 
@@ -13,8 +64,67 @@ app = Flask(__name__)
 # Constants for Pagination
 PAGE_SIZE = 5
 
-# Global variable to hold all loaded and filtered product data
-ALL_PRODUCTS = []
+# Strips currency symbols, separators and other non-numeric characters in one
+# C-level pass instead of a per-character Python filter.
+_NON_NUMERIC = re.compile(r"[^\d.]+")
+
+# Global holding all loaded and filtered product data. Frozen into a tuple at
+# load time: it is written once, iterated on every request, and a tuple both
+# rules out accidental mutation and takes CPython's leaner iteration path.
+ALL_PRODUCTS = ()
+
+# Search index built once at load time: casefolded titles, so requests never
+# re-fold them.
+ALL_TITLES_CF = []
+
+# All casefolded titles concatenated into one NUL-separated buffer, with the
+# start offset of each title. Full scans become a handful of C-level
+# str.find calls over contiguous memory instead of a Python check per title.
+TITLE_BUFFER = ''
+TITLE_STARTS = [0]
+
+# Sort keys parsed once at load time (structure-of-arrays): negated rating for
+# descending order and final price for ascending order, indexed like
+# ALL_PRODUCTS. Both are quantized to fixed-point integers — ratings at two
+# decimals, prices at cents — which is monotonic, so ordering is unchanged,
+# while the NumPy columns shrink to int16/int32 for a cheaper lexsort.
+RATING_KEY = []
+PRICE_KEY = []
+
+# Prices at or above this clamp (including missing ones parsed as inf) share
+# the int32 ceiling and sort last.
+_PRICE_CAP = 2 ** 31 // 100 - 1
+
+# Result sets at or below this size are ordered by binary insertion instead of
+# a full sort; niche queries skip list.sort's key-cache machinery entirely.
+_SMALL_SORT_CUTOFF = 64
+
+# Interned once; every imageless product reuses this single carousel tuple
+# (Jinja iterates tuples and lists identically) instead of allocating a
+# one-element list per materialized result.
+_PLACEHOLDER_IMAGES = (sys.intern("https://placehold.co/300x300/f0f0f0/666666?text=No+Images"),)
+
+
+def _intern_if_str(value):
+    """Interns heavily repeated string fields (e.g. seller names); passes
+    missing or non-string values through unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
+class Product:
+    """
+    One marketplace listing, reduced to the fields the app actually renders.
+    Slots-based attribute access skips dict hashing per field, and each record
+    drops the per-product hash table that a raw JSON dict carries.
+    """
+    title: Any = None
+    initial_price: Any = None
+    final_price: Any = None
+    rating: Any = None
+    seller_name: Any = None
+    url: Any = None
+    image: Any = None
 
 
 # Helper function to safely convert string price/rating to float for sorting
@@ -22,8 +132,11 @@ def safe_float(value, default_value=0.0):
     """Safely converts price or rating string to float for comparison."""
     try:
         if isinstance(value, str):
-            # Simple filter to keep digits and a single decimal point
-            cleaned_str = ''.join(filter(lambda x: x.isdigit() or x == '.', value))
+            # Keep digits and at most one decimal point
+            cleaned_str = _NON_NUMERIC.sub('', value)
+            if cleaned_str.count('.') > 1:
+                head, _, tail = cleaned_str.partition('.')
+                cleaned_str = head + '.' + tail.replace('.', '')
             if not cleaned_str:
                 return default_value
             return float(cleaned_str)
@@ -41,17 +154,44 @@ def process_product_data(file_path):
         print(f"Error: The file '{file_path}' was not found.")
         return None
 
+    parser = _get_simdjson_parser()
+
+    # Without simdjson, stream-filter top-level arrays through ijson when it is
+    # installed: peak memory covers only the kept records, not the whole file.
+    if parser is None and ijson is not None:
+        try:
+            with open(file_path, 'rb') as read_file:
+                if read_file.read(64).lstrip().startswith(b'['):
+                    read_file.seek(0)
+                    filtered_data = []
+                    for product in ijson.items(read_file, 'item'):
+                        price = safe_float(product.get("initial_price"), default_value=0.0)
+                        if price > 0:
+                            filtered_data.append(product)
+                    return filtered_data
+            # Top level is not an array; fall through to the in-memory parsers
+        except ijson.JSONError:
+            print(f"Error: Failed to decode JSON from '{file_path}'.")
+            return None
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as read_file:
-            data = json.load(read_file)
-    except json.JSONDecodeError:
+        if parser is not None:
+            data = parser.load(file_path)
+        elif orjson is not None:
+            with open(file_path, 'rb') as read_file:
+                data = orjson.loads(read_file.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as read_file:
+                data = json.load(read_file)
+    except (json.JSONDecodeError, ValueError):
+        # simdjson and orjson raise ValueError subclasses on malformed input
         print(f"Error: Failed to decode JSON from '{file_path}'.")
         return None
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
         return None
 
-    if not isinstance(data, list):
+    if isinstance(data, dict) or (parser is not None and isinstance(data, simdjson.Object)):
         data = [data]
 
     filtered_data = []
@@ -63,6 +203,10 @@ def process_product_data(file_path):
 
         # Only include the product if the price is greater than 0
         if price > 0:
+            if parser is not None:
+                # Detach the survivor from the parser's reusable buffer, since
+                # ALL_PRODUCTS outlives the next parser.load() call.
+                product = product.as_dict()
             filtered_data.append(product)
 
     return filtered_data
@@ -70,108 +214,217 @@ def process_product_data(file_path):
 
 def load_all_products():
     """Aggregates and loads all product data from the defined file paths."""
-    global ALL_PRODUCTS
+    global ALL_PRODUCTS, ALL_TITLES_CF, RATING_KEY, PRICE_KEY
+    global TITLE_BUFFER, TITLE_STARTS
     products = []
-    for file_path in FILE_PATHS:
-        data = process_product_data(file_path)
-        if data:
-            products.extend(data)
+    # Load the files concurrently: the threads overlap file I/O, and simdjson
+    # (when installed) releases the GIL during parsing so the CPU work overlaps
+    # too. ex.map yields in submission order, preserving aggregation order.
+    with ThreadPoolExecutor(max_workers=len(FILE_PATHS)) as ex:
+        for data in ex.map(process_product_data, FILE_PATHS):
+            if data:
+                products.extend(data)
+
+    # Store the loaded data globally once, frozen against later mutation.
+    # Each raw dict becomes a slots-based Product record.
+    ALL_PRODUCTS = tuple(
+        Product(
+            title=p.get("title"),
+            initial_price=p.get("initial_price"),
+            final_price=p.get("final_price"),
+            rating=p.get("rating"),
+            seller_name=_intern_if_str(p.get("seller_name")),
+            url=p.get("url"),
+            image=p.get("image"),
+        )
+        for p in products
+    )
+
+    # Build the search index once so per-request searching never casefolds
+    # or stringifies titles again. casefold() matches Unicode case better than
+    # lower() for international titles and is still O(n) in C.
+    ALL_TITLES_CF = [('' if p.title is None else str(p.title)).casefold() for p in ALL_PRODUCTS]
+
+    # Flatten the titles into one contiguous buffer for the scan fast path
+    TITLE_BUFFER = '\x00'.join(ALL_TITLES_CF)
+    TITLE_STARTS = [0]
+    for title in ALL_TITLES_CF:
+        TITLE_STARTS.append(TITLE_STARTS[-1] + len(title) + 1)
+
+    # Parse sort keys once so per-request sorting never calls safe_float.
+    RATING_KEY = [round(-safe_float(p.rating, default_value=0.0) * 100) for p in ALL_PRODUCTS]
+    PRICE_KEY = [round(min(safe_float(p.final_price, default_value=float('inf')), _PRICE_CAP) * 100)
+                 for p in ALL_PRODUCTS]
+    if np is not None:
+        # Columnar fixed-point layout for vectorized integer sorting. The
+        # arrays are marked read-only so that, under a preloading server
+        # (gunicorn --preload), the copy-on-write pages shared with forked
+        # workers can never be dirtied.
+        RATING_KEY = np.asarray(RATING_KEY, dtype=np.int16)
+        PRICE_KEY = np.asarray(PRICE_KEY, dtype=np.int32)
+        RATING_KEY.setflags(write=False)
+        PRICE_KEY.setflags(write=False)
+
+    # Cached search results are stale once the index is rebuilt
+    _search_cached.cache_clear()
 
-    # Store the loaded data globally once
-    ALL_PRODUCTS = products
     print(f"Flask App Initialized: Loaded a total of {len(ALL_PRODUCTS)} products.")
 
 
-def search_product(search_item, all_products):
+def _scan_title_buffer(search_term):
     """
-    Searches for a product, sorts the results, and returns the best deal and the full sorted list.
-
-    Updated: Stores the full list of image URLs for the carousel.
+    Finds all product indices whose title contains search_term by scanning the
+    concatenated TITLE_BUFFER. The NUL separators guarantee a match never
+    spans two titles, and each hit is mapped back to its product index with a
+    binary search over TITLE_STARTS.
     """
-    search_term = search_item.lower()
-    found_products = []
-
-    for product in all_products:
-        title = str(product.get("title", "")).lower()
-        if search_term in title:
-            found_products.append(product)
-
-    if not found_products:
+    idx = []
+    pos = TITLE_BUFFER.find(search_term)
+    while pos != -1:
+        i = bisect.bisect_right(TITLE_STARTS, pos) - 1
+        idx.append(i)
+        # Resume after this title so each product is reported once
+        pos = TITLE_BUFFER.find(search_term, TITLE_STARTS[i + 1])
+    return idx
+
+
+def _materialize(index):
+    """Builds the presentation dict for a single product index (mapping the raw
+    JSON fields to the template's required keys)."""
+    product = ALL_PRODUCTS[index]
+
+    # Use 'url' field for product link
+    product_url = product.url or "#"
+
+    # Store the full list of image URLs for the carousel; provide a placeholder
+    # array if the images list is missing or invalid.
+    images_list = product.image
+    image_urls = images_list if isinstance(images_list, list) and images_list else _PLACEHOLDER_IMAGES
+
+    return {
+        "title": product.title if product.title is not None else "N/A",
+        "initial_price": str(product.initial_price) if product.initial_price is not None else "N/A",
+        "final_price": str(product.final_price) if product.final_price is not None else "N/A",
+        "rating": str(product.rating) if product.rating is not None else "N/A",
+        "seller_name": product.seller_name or "N/A",
+        "product_url": product_url,
+        "image_urls": image_urls,  # <-- Stores a LIST of URLs for the carousel
+    }
+
+
+@functools.lru_cache(maxsize=512)
+def _search_cached(search_term):
+    """
+    Core search over the module-level index: scans and sorts for a casefolded
+    search term, returning the best-deal dict plus the ordered list of product
+    indices. ALL_PRODUCTS is immutable after startup, so results are memoized
+    per term; dict materialization is left to the caller's page slice.
+    """
+    # One C-level pass over the flat title buffer; only a term that could
+    # collide with the NUL separators falls back to the per-title loop.
+    if '\x00' not in search_term:
+        idx = _scan_title_buffer(search_term)
+    else:
+        idx = [i for i, title in enumerate(ALL_TITLES_CF) if search_term in title]
+
+    if not idx and ' ' in search_term:
+        # Multi-term fallback: when the exact phrase matches nothing, look for
+        # titles containing every token in any order — one buffer pass per
+        # token, intersected. The lru_cache on this function doubles as the
+        # per-term cache for the multi-pattern scan.
+        common = None
+        for token in search_term.split():
+            hits = set(_scan_title_buffer(token))
+            common = hits if common is None else common & hits
+            if not common:
+                break
+        idx = sorted(common) if common else []
+
+    if not idx:
         return None, []
 
     # --- SORTING LOGIC ---
     # Primary Sort: Rating (Descending)
     # Secondary Sort: Final Price (Ascending)
-    found_products.sort(key=lambda p: (
-        -safe_float(p.get("rating"), default_value=0.0),  # Highest Rating first
-        safe_float(p.get("final_price"), default_value=float('inf'))  # Lowest Price first
-    ))
-
-    # Clean up results for presentation (Mapping new JSON fields to template fields)
-    cleaned_results = []
-    for product in found_products:
-        # Use 'url' field for product link
-        product_url = product.get("url", "#")
+    # The keys were parsed at load time; RATING_KEY is already negated, so plain
+    # ascending order gives highest-rating-first.
+    if len(idx) <= _SMALL_SORT_CUTOFF:
+        # Common niche-query case: insert the few matches in order directly.
+        # The trailing index breaks ties by original position, matching the
+        # stability of the sort-based paths.
+        keyed = []
+        for i in idx:
+            bisect.insort(keyed, (RATING_KEY[i], PRICE_KEY[i], i))
+        idx = [entry[2] for entry in keyed]
+    elif np is not None:
+        idx = np.asarray(idx, dtype=np.intp)
+        # lexsort treats its last key as primary: rating first, then price
+        order = np.lexsort((PRICE_KEY[idx], RATING_KEY[idx]))
+        idx = idx[order].tolist()
+    else:
+        idx.sort(key=lambda i: (RATING_KEY[i], PRICE_KEY[i]))
+
+    # Only the best-deal card is built eagerly; the route materializes dicts
+    # for just the PAGE_SIZE indices it actually renders.
+    return _materialize(idx[0]), idx
 
-        # --- NEW: Store the full list of image URLs for the carousel ---
-        images_list = product.get("image", [])
-        # Provide a placeholder array if images list is missing or invalid
-        image_urls = images_list if isinstance(images_list, list) and images_list else [
-            "https://placehold.co/300x300/f0f0f0/666666?text=No+Images"]
 
-        cleaned_results.append({
-            "title": product.get("title", "N/A"),
-            "initial_price": str(product.get("initial_price", "N/A")),
-            "final_price": str(product.get("final_price", "N/A")),
-            "rating": str(product.get("rating", "N/A")),
-            "seller_name": product.get("seller_name", "N/A"),
-
-            # Map the JSON keys to the template's required keys
-            "product_url": product_url,
-            "image_urls": image_urls,  # <-- Stores a LIST of URLs for the carousel
-        })
-
-    best_deal = cleaned_results[0]
+def search_product(search_item, all_products):
+    """
+    Searches for a product and returns the best deal plus the ordered list of
+    matching indices into ALL_PRODUCTS (highest rating first, then lowest
+    price). Results are cached per casefolded search term, so pagination
+    clicks for the same query skip the scan and sort entirely.
 
-    # Return ALL sorted results for pagination logic in the route
-    return best_deal, cleaned_results
+    Blank or whitespace-only input short-circuits to no results: the empty
+    substring would otherwise match (and sort) the entire catalog.
+    """
+    search_term = search_item.strip().casefold()
+    if not search_term:
+        return None, []
+    return _search_cached(search_term)
 
 
 # --- Flask Routes ---
 
 @app.route('/', methods=['GET', 'POST'])
 def index():
-    # Retrieve search item from form (POST) or URL parameters (GET for pagination)
-    search_item = request.form.get('search_item') or request.args.get('search_item')
+    # Retrieve search item from form (POST) or URL parameters (GET for pagination),
+    # stripped once so a whitespace-only submit skips the search entirely
+    search_item = (request.form.get('search_item') or request.args.get('search_item') or '').strip()
     page = request.args.get('page', 1, type=int)
     page_size = PAGE_SIZE  # Fixed page size
 
     best_deal = None
-    all_results = []  # All results found (before pagination)
+    result_indices = []  # Ordered indices of all matches (before pagination)
     paginated_results = []
     total_products = 0
     total_pages = 0
 
     # The search runs if a search term is present (initial search or pagination click)
     if search_item and ALL_PRODUCTS:
-        best_deal, all_results = search_product(search_item, ALL_PRODUCTS)
+        best_deal, result_indices = search_product(search_item, ALL_PRODUCTS)
 
-        if all_results:
-            total_products = len(all_results)
+        if result_indices:
+            total_products = len(result_indices)
             total_pages = (total_products + page_size - 1) // page_size
 
             # Ensure page number is valid
             if page < 1: page = 1
-            if page > total_pages and total_pages > 0: page = total_pages
-
-            # Apply pagination slice
+            if page > total_pages and total_pages > 0:
+                # Bounce overflowing page numbers (e.g. a crawler spamming
+                # ?page=99999) back to the last page before doing any
+                # materialization work. The count came from the term cache,
+                # so nothing expensive ran to get here.
+                return redirect(url_for('index', search_item=search_item, page=total_pages))
+
+            # Apply pagination slice; only this page's dicts are ever built
             start_index = (page - 1) * page_size
             end_index = start_index + page_size
-            paginated_results = all_results[start_index:end_index]
+            paginated_results = [_materialize(i) for i in result_indices[start_index:end_index]]
 
-    # Pass data to the template
-    return render_template_string(
-        HTML_TEMPLATE,
+    # Pass data to the precompiled template
+    return _TEMPLATE.render(
         search_item=search_item,
         best_deal=best_deal,
         results=paginated_results,
@@ -366,6 +619,11 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# Compile the template once at startup; render_template_string would re-lex and
+# re-parse the whole template string on every request. url_for and friends are
+# available through the app's Jinja environment as usual.
+_TEMPLATE = app.jinja_env.from_string(HTML_TEMPLATE)
+
 # Call load_all_products to populate the ALL_PRODUCTS list when the app starts
 load_all_products()
 
@@ -1,5 +1,25 @@
 import json
 import os
+import re
+
+# Optional SIMD-accelerated JSON parser (pysimdjson). The parser is created once at
+# module level and reused for every file, since it owns an internal padded buffer.
+try:
+    import simdjson
+    _SIMDJSON_PARSER = simdjson.Parser()
+except ImportError:
+    _SIMDJSON_PARSER = None
+
+# Optional orjson, used when pysimdjson is not installed: a Rust implementation
+# with SIMD-accelerated scanning, still 2-3x faster than the stdlib parser.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Strips currency symbols, separators and other non-numeric characters in one
+# C-level pass instead of a per-character Python filter.
+_NON_NUMERIC = re.compile(r"[^\d.]+")
 
 # Define the file paths for all data sources
 file_paths = ['Lazada - Products PH.json', 'Lazada - Products.json', 'Shopee - products.json']
@@ -19,16 +39,23 @@ def process_product_data(file_path):
 
     try:
         # Open the file and load the JSON data
-        with open(file_path, 'r', encoding='utf-8') as read_file:
-            data = json.load(read_file)
-    except json.JSONDecodeError:
+        if _SIMDJSON_PARSER is not None:
+            data = _SIMDJSON_PARSER.load(file_path)
+        elif orjson is not None:
+            with open(file_path, 'rb') as read_file:
+                data = orjson.loads(read_file.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as read_file:
+                data = json.load(read_file)
+    except (json.JSONDecodeError, ValueError):
+        # simdjson and orjson raise ValueError subclasses on malformed input
         print(f"Error: Failed to decode JSON from '{file_path}'. Check if the file content is valid JSON.")
         return None
     except Exception as e:
         print(f"An unexpected error occurred while opening or reading the file: {e}")
         return None
 
-    if not isinstance(data, list):
+    if isinstance(data, dict) or (_SIMDJSON_PARSER is not None and isinstance(data, simdjson.Object)):
         data = [data]
 
     original_count = len(data)
@@ -40,7 +67,7 @@ def process_product_data(file_path):
         # Attempt to convert the price to a float for comparison
         try:
             if isinstance(initial_price_value, str):
-                cleaned_price_str = ''.join(filter(lambda x: x.isdigit() or x == '.', initial_price_value))
+                cleaned_price_str = _NON_NUMERIC.sub('', initial_price_value)
                 price = float(cleaned_price_str)
             else:
                 price = float(initial_price_value)
@@ -49,6 +76,10 @@ def process_product_data(file_path):
 
         # Only include the product if the price is greater than 0
         if price > 0:
+            if _SIMDJSON_PARSER is not None:
+                # Detach the survivor from the parser's reusable buffer, since the
+                # aggregated product list outlives the next parser.load() call.
+                product = product.as_dict()
             filtered_data.append(product)
 
     data = filtered_data
@@ -72,8 +103,11 @@ def search_product(search_item, all_products):
     def safe_float(value, default_value=0.0):
         try:
             if isinstance(value, str):
-                # Simple filter to keep digits and a single decimal point
-                cleaned_str = ''.join(filter(lambda x: x.isdigit() or x == '.', value))
+                # Keep digits and at most one decimal point
+                cleaned_str = _NON_NUMERIC.sub('', value)
+                if cleaned_str.count('.') > 1:
+                    head, _, tail = cleaned_str.partition('.')
+                    cleaned_str = head + '.' + tail.replace('.', '')
                 return float(cleaned_str)
             return float(value)
         except (TypeError, ValueError):
@@ -0,0 +1,19 @@
+"""
+WSGI entry point for running the app under Gunicorn.
+
+The application file is named 'marketplace_checker-flask.py', which is not an
+importable module name because of the hyphen, so it is loaded here via
+importlib. Importing it runs load_all_products(), which means that under
+`gunicorn --preload` (see gunicorn.conf.py) the product data and all search
+indexes are built once in the master process and shared with the forked
+workers through copy-on-write pages.
+"""
+import importlib.util
+import pathlib
+
+_path = pathlib.Path(__file__).with_name("marketplace_checker-flask.py")
+_spec = importlib.util.spec_from_file_location("marketplace_checker_flask", _path)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+
+app = _module.app